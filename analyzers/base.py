@@ -4,6 +4,7 @@ Base class for all page analyzers.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Iterable
 
 from models import AuditConfig, Issue, PageData, Severity
 
@@ -13,14 +14,20 @@ class BaseAnalyzer(ABC):
 
     category: str = "Uncategorized"
 
+    def applies_to(self, page: PageData) -> bool:
+        """Cheap pre-check: False means analyze() would find nothing on this page,
+        so the orchestrator skips the call. This is the only place it is checked."""
+        return True
+
     @abstractmethod
     def analyze(
         self,
         page: PageData,
         all_pages: dict[str, PageData],
         config: AuditConfig,
-    ) -> list[Issue]:
-        """Analyze a single page and return a list of issues."""
+    ) -> Iterable[Issue]:
+        """Analyze a single page and yield its issues (a plain list is fine too).
+        Assumes applies_to(page) is True — direct callers must check it first."""
         ...
 
     # ── Convenience factory ───────────────────────────────────────────────────
@@ -35,22 +42,20 @@ class BaseAnalyzer(ABC):
         detail: str = "",
         affected_element: str = "",
     ) -> Issue:
+        # Positional, in Issue field order — this runs for every issue emitted
         return Issue(
-            url=url,
-            category=self.category,
-            issue_type=issue_type,
-            severity=severity,
-            description=description,
-            recommendation=recommendation,
-            detail=detail,
-            affected_element=affected_element,
+            url, self.category, issue_type, severity,
+            description, recommendation, detail, affected_element,
         )
 
+    # These build the Issue directly rather than via _issue(): one call frame
+    # per emitted issue instead of two
+
     def critical(self, url, issue_type, description, recommendation, detail="", element="") -> Issue:
-        return self._issue(url, issue_type, Severity.CRITICAL, description, recommendation, detail, element)
+        return Issue(url, self.category, issue_type, Severity.CRITICAL, description, recommendation, detail, element)
 
     def warning(self, url, issue_type, description, recommendation, detail="", element="") -> Issue:
-        return self._issue(url, issue_type, Severity.WARNING, description, recommendation, detail, element)
+        return Issue(url, self.category, issue_type, Severity.WARNING, description, recommendation, detail, element)
 
     def info(self, url, issue_type, description, recommendation, detail="", element="") -> Issue:
-        return self._issue(url, issue_type, Severity.INFO, description, recommendation, detail, element)
+        return Issue(url, self.category, issue_type, Severity.INFO, description, recommendation, detail, element)
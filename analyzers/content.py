@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import difflib
 from itertools import combinations
+from typing import Iterator
 
 from models import AuditConfig, Issue, PageData
 from analyzers.base import BaseAnalyzer
@@ -14,114 +15,104 @@ from config import (
     THIN_CONTENT_WORD_COUNT,
 )
 
+# Heading-level bits for the hierarchy check
+_H2, _H3, _H4 = 1 << 2, 1 << 3, 1 << 4
+
 
 class ContentAnalyzer(BaseAnalyzer):
     category = "Content"
 
+    def applies_to(self, page: PageData) -> bool:
+        return page.is_html and 200 <= page.status_code < 300
+
     def analyze(
         self,
         page: PageData,
         all_pages: dict[str, PageData],
         config: AuditConfig,
-    ) -> list[Issue]:
-        if not page.is_html or page.status_code not in range(200, 300):
-            return []
-
-        issues: list[Issue] = []
+    ) -> Iterator[Issue]:
         url = page.url
 
         # ── H1 ────────────────────────────────────────────────────────────────
         if not page.h1_tags:
             if page.is_indexable:
-                issues.append(self.warning(
+                yield self.warning(
                     url, "missing_h1",
                     "Page has no H1 heading.",
                     "Add a single, descriptive H1 that includes the primary keyword.",
                     element="<h1>",
-                ))
+                )
         else:
             if len(page.h1_tags) > 1:
-                issues.append(self.warning(
+                yield self.warning(
                     url, "multiple_h1",
                     f"Page has {len(page.h1_tags)} H1 headings. Only one is recommended.",
                     "Consolidate to a single H1 that best describes the page's main topic.",
                     detail=" | ".join(page.h1_tags[:3]),
                     element="<h1>",
-                ))
+                )
             for h1 in page.h1_tags:
                 if len(h1) > H1_MAX_LENGTH:
-                    issues.append(self.info(
+                    yield self.info(
                         url, "h1_too_long",
                         f"H1 is too long ({len(h1)} chars). Recommended max is {H1_MAX_LENGTH}.",
                         "Shorten the H1 to be concise and keyword-focused.",
                         detail=h1[:100],
                         element="<h1>",
-                    ))
+                    )
 
         # ── Heading hierarchy ─────────────────────────────────────────────────
-        issues.extend(self._check_heading_hierarchy(page))
+        yield from self._check_heading_hierarchy(page)
 
         # ── Word count / thin content ─────────────────────────────────────────
         if page.is_indexable and page.word_count < THIN_CONTENT_WORD_COUNT:
             if page.word_count == 0:
-                issues.append(self.warning(
+                yield self.warning(
                     url, "no_content",
                     "Page appears to have no visible text content.",
                     "Add meaningful content that serves user intent. Blank pages harm SEO.",
-                ))
+                )
             else:
-                issues.append(self.warning(
+                yield self.warning(
                     url, "thin_content",
                     f"Page has only {page.word_count} words — below the {THIN_CONTENT_WORD_COUNT}-word threshold for thin content.",
                     "Expand the page with useful, relevant content or consider consolidating with a similar page.",
                     detail=f"{page.word_count} words",
-                ))
+                )
 
         # ── H2 missing on long pages ──────────────────────────────────────────
         if page.word_count > 500 and not page.h2_tags:
-            issues.append(self.info(
+            yield self.info(
                 url, "missing_h2",
                 "Long page has no H2 subheadings. Subheadings improve readability and SEO.",
                 "Break content into sections with descriptive H2 subheadings.",
                 element="<h2>",
-            ))
-
-        return issues
+            )
 
-    def _check_heading_hierarchy(self, page: PageData) -> list[Issue]:
+    def _check_heading_hierarchy(self, page: PageData) -> Iterator[Issue]:
         """Detect skipped heading levels (e.g. H1 → H3 with no H2)."""
-        issues: list[Issue] = []
-
-        # Build ordered list of (level, text)
-        headings: list[tuple[int, str]] = []
-        for h1 in page.h1_tags:
-            headings.append((1, h1))
-        for h2 in page.h2_tags:
-            headings.append((2, h2))
-        for h in page.h3_h6_tags:
-            headings.append((h["level"], h["text"]))
-
         # Sort by first occurrence is complex without position tracking.
         # Do a simpler structural check: if we have h3 but no h2, that's a skip.
-        levels_present = {h[0] for h in headings}
+        # Bit n of `levels` is set when an H<n> is present (H1 never matters here).
+        levels = _H2 if page.h2_tags else 0
+        for h in page.h3_h6_tags:
+            levels |= 1 << h["level"]
 
-        if 3 in levels_present and 2 not in levels_present:
-            issues.append(self.info(
+        if levels & _H3 and not levels & _H2:
+            yield self.info(
                 page.url, "skipped_heading_level",
                 "Page uses H3 headings but has no H2 — heading hierarchy is skipped.",
                 "Ensure heading levels are sequential (H1 → H2 → H3) for proper document structure.",
                 element="<h3>",
-            ))
+            )
 
-        if 4 in levels_present and 3 not in levels_present:
-            issues.append(self.info(
+        if levels & _H4 and not levels & _H3:
+            yield self.info(
                 page.url, "skipped_heading_level",
                 "Page uses H4 headings but has no H3 — heading hierarchy is skipped.",
                 "Ensure heading levels are sequential for proper document structure.",
                 element="<h4>",
-            ))
-
-        return issues
+            )
 
 
 class DuplicateContentAnalyzer(BaseAnalyzer):
@@ -147,7 +138,7 @@ class DuplicateContentAnalyzer(BaseAnalyzer):
         candidates = {
             url: page for url, page in all_pages.items()
             if page.is_html
-            and page.status_code in range(200, 300)
+            and 200 <= page.status_code < 300
             and page.is_indexable
             and page.word_count > 50
         }
@@ -159,7 +150,7 @@ class DuplicateContentAnalyzer(BaseAnalyzer):
                 hash_map.setdefault(page.content_hash, []).append(url)
 
         already_flagged: set[str] = set()
-        for h, urls in hash_map.items():
+        for urls in hash_map.values():
             if len(urls) > 1:
                 for url in urls:
                     already_flagged.add(url)
@@ -177,20 +168,26 @@ class DuplicateContentAnalyzer(BaseAnalyzer):
             if url not in already_flagged
         ][:200]
 
-        # Pre-filter using word-set Jaccard similarity to avoid O(n^2) difflib calls
-        checked_pairs: set[frozenset] = set()
-        for i, (url_a, page_a) in enumerate(remaining):
-            words_a = set(page_a.text_content.lower().split()[:500])
+        # Pre-filter using word-set Jaccard similarity to avoid O(n^2) difflib calls.
+        # Word sets are built once per page, not once per pair.
+        word_sets = [set(page.text_content.lower().split()[:500]) for _, page in remaining]
+        heads     = [page.text_content[:3000] for _, page in remaining]
+
+        # i < j over unique URLs, so each pair is visited exactly once
+        for i, (url_a, _) in enumerate(remaining):
+            words_a = word_sets[i]
             if not words_a:
                 continue
-            for url_b, page_b in remaining[i + 1:]:
-                pair = frozenset([url_a, url_b])
-                if pair in checked_pairs:
+            for j in range(i + 1, len(remaining)):
+                url_b = remaining[j][0]
+                words_b = word_sets[j]
+                if not words_b:
                     continue
-                checked_pairs.add(pair)
 
-                words_b = set(page_b.text_content.lower().split()[:500])
-                if not words_b:
+                # Size bound: Jaccard can never exceed min/max of the set sizes
+                # (integer form so a subset at exactly 0.7 is not skipped)
+                len_a, len_b = len(words_a), len(words_b)
+                if 10 * min(len_a, len_b) < 7 * max(len_a, len_b):
                     continue
 
                 # Jaccard pre-filter
@@ -198,12 +195,12 @@ class DuplicateContentAnalyzer(BaseAnalyzer):
                 if jaccard < 0.7:
                     continue
 
-                # Full difflib comparison
-                ratio = difflib.SequenceMatcher(
-                    None,
-                    page_a.text_content[:3000],
-                    page_b.text_content[:3000],
-                ).ratio()
+                # Length bound (SequenceMatcher.real_quick_ratio) before paying
+                # for the matcher's b2j index and the full difflib comparison
+                len_a, len_b = len(heads[i]), len(heads[j])
+                if 2 * min(len_a, len_b) / (len_a + len_b) < DUPLICATE_CONTENT_SIMILARITY_THRESHOLD:
+                    continue
+                ratio = difflib.SequenceMatcher(None, heads[i], heads[j]).ratio()
 
                 if ratio >= DUPLICATE_CONTENT_SIMILARITY_THRESHOLD:
                     for url in [url_a, url_b]:
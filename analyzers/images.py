@@ -3,82 +3,86 @@ Image analyzer: missing alt text, broken images, large file sizes, lazy loading.
 """
 from __future__ import annotations
 
+from typing import Iterator
+
 from models import AuditConfig, Issue, PageData
 from analyzers.base import BaseAnalyzer
 from config import LARGE_IMAGE_SIZE_BYTES
 
+_LARGE_IMAGE_KB = LARGE_IMAGE_SIZE_BYTES // 1024
+
 
 class ImageAnalyzer(BaseAnalyzer):
     category = "Images"
 
+    def applies_to(self, page: PageData) -> bool:
+        return page.is_html and 200 <= page.status_code < 300
+
     def analyze(
         self,
         page: PageData,
         all_pages: dict[str, PageData],
         config: AuditConfig,
-    ) -> list[Issue]:
-        if not page.is_html or page.status_code not in range(200, 300):
-            return []
+    ) -> Iterator[Issue]:
+        images = page.images
+        if not images:
+            return
 
-        issues: list[Issue] = []
         url = page.url
-
-        has_any_lazy = any(img.loading == "lazy" for img in page.images)
         above_fold_threshold = 3  # first N images assumed above fold
 
-        for idx, img in enumerate(page.images):
+        for idx, img in enumerate(images):
             # ── Broken image ──────────────────────────────────────────────────
             if img.is_broken:
-                issues.append(self.critical(
+                yield self.critical(
                     url, "broken_image",
                     "Image is broken (returns 4xx/5xx or failed to load).",
                     "Fix the broken image URL or remove the <img> tag.",
                     detail=img.src,
                     element="<img>",
-                ))
+                )
                 continue
 
             # ── Missing alt text ──────────────────────────────────────────────
             # alt="" is valid for decorative images; missing alt attribute is the problem
             if img.alt == "" and not _is_likely_decorative(img):
-                issues.append(self.warning(
+                yield self.warning(
                     url, "missing_alt_text",
                     "Image is missing alt text. This hurts accessibility and image SEO.",
                     "Add descriptive alt text that conveys the image's content and function.",
                     detail=img.src,
                     element="<img>",
-                ))
+                )
 
             # ── Large image ───────────────────────────────────────────────────
             if img.size_bytes > LARGE_IMAGE_SIZE_BYTES:
                 size_kb = img.size_bytes // 1024
-                issues.append(self.warning(
+                yield self.warning(
                     url, "large_image",
-                    f"Image is {size_kb} KB — larger than the recommended {LARGE_IMAGE_SIZE_BYTES // 1024} KB.",
+                    f"Image is {size_kb} KB — larger than the recommended {_LARGE_IMAGE_KB} KB.",
                     "Compress and optimize this image, or use modern formats (WebP, AVIF).",
                     detail=f"{img.src} ({size_kb} KB)",
                     element="<img>",
-                ))
+                )
 
             # ── Missing lazy loading ──────────────────────────────────────────
-            if idx >= above_fold_threshold and img.loading != "lazy" and len(page.images) > above_fold_threshold:
-                issues.append(self.info(
+            # (idx past the threshold already implies the page has more images than it)
+            if idx >= above_fold_threshold and img.loading != "lazy":
+                yield self.info(
                     url, "missing_lazy_load",
                     "Below-fold image is not using lazy loading.",
                     'Add loading="lazy" to images that are not visible on initial page load.',
                     detail=img.src,
                     element="<img>",
-                ))
+                )
 
         # ── No lazy loading at all on image-heavy pages ───────────────────────
-        if len(page.images) > 3 and not has_any_lazy:
-            issues.append(self.info(
+        if len(images) > 3 and not any(img.loading == "lazy" for img in images):
+            yield self.info(
                 url, "no_lazy_loading",
-                f"Page has {len(page.images)} images but none use lazy loading.",
+                f"Page has {len(images)} images but none use lazy loading.",
                 'Add loading="lazy" to below-fold images to improve initial page load performance.',
-            ))
-
-        return issues
+            )
 
 
 def _is_likely_decorative(img) -> bool:
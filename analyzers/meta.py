@@ -3,6 +3,10 @@ Meta tag analyzer: title, description, meta robots, viewport, keywords.
 """
 from __future__ import annotations
 
+import hashlib
+from collections import defaultdict
+from typing import Iterator
+
 from models import AuditConfig, Issue, PageData
 from analyzers.base import BaseAnalyzer
 from config import (
@@ -16,108 +20,105 @@ from config import (
 class MetaAnalyzer(BaseAnalyzer):
     category = "Meta"
 
+    def applies_to(self, page: PageData) -> bool:
+        return page.is_html and 200 <= page.status_code < 300
+
     def analyze(
         self,
         page: PageData,
         all_pages: dict[str, PageData],
         config: AuditConfig,
-    ) -> list[Issue]:
-        if not page.is_html or page.status_code not in range(200, 300):
-            return []
-
-        issues: list[Issue] = []
+    ) -> Iterator[Issue]:
         url = page.url
 
         # ── Title ─────────────────────────────────────────────────────────────
         if page.title is None or page.title.strip() == "":
-            issues.append(self.critical(
+            yield self.critical(
                 url, "missing_title",
                 "Page is missing a <title> tag.",
                 "Add a descriptive <title> tag between 30–60 characters.",
-            ))
+            )
         else:
             title = page.title.strip()
             length = len(title)
 
             if length < TITLE_MIN_CHARS:
-                issues.append(self.warning(
+                yield self.warning(
                     url, "title_too_short",
                     f"Title is too short ({length} chars). Minimum recommended is {TITLE_MIN_CHARS}.",
                     "Expand the title to be more descriptive (30–60 characters).",
                     detail=title,
-                ))
+                )
             elif length > TITLE_MAX_CHARS:
-                issues.append(self.warning(
+                yield self.warning(
                     url, "title_too_long",
                     f"Title is too long ({length} chars). Google truncates titles above ~{TITLE_MAX_CHARS} chars.",
                     "Shorten the title to under 60 characters to prevent truncation in SERPs.",
                     detail=title,
-                ))
+                )
 
         # ── Description ───────────────────────────────────────────────────────
         if page.meta_description is None or page.meta_description.strip() == "":
-            issues.append(self.warning(
+            yield self.warning(
                 url, "missing_description",
                 "Page is missing a meta description.",
                 "Add a unique meta description between 70–160 characters to improve click-through rates.",
-            ))
+            )
         else:
             desc = page.meta_description.strip()
             length = len(desc)
 
             if length < DESCRIPTION_MIN_CHARS:
-                issues.append(self.warning(
+                yield self.warning(
                     url, "description_too_short",
                     f"Meta description is too short ({length} chars). Recommended minimum is {DESCRIPTION_MIN_CHARS}.",
                     "Expand the meta description to 70–160 characters.",
                     detail=desc,
-                ))
+                )
             elif length > DESCRIPTION_MAX_CHARS:
-                issues.append(self.warning(
+                yield self.warning(
                     url, "description_too_long",
                     f"Meta description is too long ({length} chars). Google may truncate after ~{DESCRIPTION_MAX_CHARS} chars.",
                     "Shorten the meta description to under 160 characters.",
                     detail=desc,
-                ))
+                )
 
         # ── Viewport ──────────────────────────────────────────────────────────
         if not page.meta_viewport:
-            issues.append(self.warning(
+            yield self.warning(
                 url, "missing_viewport",
                 "Page is missing a viewport meta tag. This may cause poor mobile rendering.",
                 'Add <meta name="viewport" content="width=device-width, initial-scale=1">.',
                 element="<meta name='viewport'>",
-            ))
+            )
 
         # ── Meta robots ───────────────────────────────────────────────────────
         if page.meta_robots:
             robots_lower = page.meta_robots.lower()
             if "noindex" in robots_lower:
-                issues.append(self.info(
+                yield self.info(
                     url, "noindex_set",
                     "Page has noindex directive — it will not appear in search results.",
                     "If this page should be indexed, remove the noindex directive.",
                     detail=page.meta_robots,
                     element="<meta name='robots'>",
-                ))
+                )
             if "nofollow" in robots_lower:
-                issues.append(self.info(
+                yield self.info(
                     url, "nofollow_set",
                     "Page has nofollow directive — search engines will not follow links on this page.",
                     "Use nofollow only when intentional. Remove if links should be followed.",
                     detail=page.meta_robots,
-                ))
+                )
 
         # ── X-Robots-Tag ──────────────────────────────────────────────────────
         if page.x_robots_tag and "noindex" in page.x_robots_tag.lower():
-            issues.append(self.info(
+            yield self.info(
                 url, "x_robots_noindex",
                 "X-Robots-Tag response header contains noindex.",
                 "If this page should be indexed, remove the X-Robots-Tag: noindex header.",
                 detail=page.x_robots_tag,
-            ))
-
-        return issues
+            )
 
 
 class DuplicateMetaAnalyzer(BaseAnalyzer):
@@ -144,41 +145,61 @@ class DuplicateMetaAnalyzer(BaseAnalyzer):
         issues: list[Issue] = []
         analyzer = DuplicateMetaAnalyzer()
 
-        # Build lookup dicts
-        title_map: dict[str, list[str]] = {}
-        desc_map: dict[str, list[str]] = {}
+        # Build lookup dicts, keyed by a 16-byte digest of the normalised text
+        # so the maps don't hold a lowercased copy of every title/description
+        title_map: defaultdict[bytes, list[str]] = defaultdict(list)
+        desc_map: defaultdict[bytes, list[str]] = defaultdict(list)
 
         for url, page in all_pages.items():
-            if not page.is_html or page.status_code not in range(200, 300):
+            if not page.is_html or not (200 <= page.status_code < 300):
                 continue
 
             if page.title:
-                t = page.title.strip().lower()
-                title_map.setdefault(t, []).append(url)
+                title_map[_text_key(page.title)].append(url)
 
             if page.meta_description:
-                d = page.meta_description.strip().lower()
-                desc_map.setdefault(d, []).append(url)
+                desc_map[_text_key(page.meta_description)].append(url)
 
         # Emit one issue per URL (not per pair)
-        for title_key, urls in title_map.items():
+        for urls in title_map.values():
             if len(urls) > 1:
-                for url in urls:
+                for url, shared in zip(urls, _shared_with(urls)):
                     issues.append(analyzer.warning(
                         url, "duplicate_title",
                         f"Duplicate title found on {len(urls)} pages.",
                         "Each page should have a unique, descriptive title.",
-                        detail=f"Shared with: {', '.join(u for u in urls if u != url)[:200]}",
+                        detail=f"Shared with: {shared}",
                     ))
 
-        for desc_key, urls in desc_map.items():
+        for urls in desc_map.values():
             if len(urls) > 1:
-                for url in urls:
+                for url, shared in zip(urls, _shared_with(urls)):
                     issues.append(analyzer.warning(
                         url, "duplicate_description",
                         f"Duplicate meta description found on {len(urls)} pages.",
                         "Each page should have a unique meta description.",
-                        detail=f"Shared with: {', '.join(u for u in urls if u != url)[:200]}",
+                        detail=f"Shared with: {shared}",
                     ))
 
         return issues
+
+
+def _text_key(text: str) -> bytes:
+    return hashlib.blake2b(text.strip().lower().encode("utf-8"), digest_size=16).digest()
+
+
+def _shared_with(urls: list[str]) -> list[str]:
+    """
+    The 200-char "other URLs" list for each member of a duplicate group.
+    Only the first few URLs reach into that prefix, so every later URL
+    shares one string and a group of k costs O(k) rather than O(k²).
+    """
+    lead, length = 0, -2
+    while lead < len(urls) and length < 200:
+        length += len(urls[lead]) + 2
+        lead += 1
+    common = ", ".join(urls[:lead])[:200]
+    return [
+        ", ".join(u for u in urls if u != url)[:200] if i < lead else common
+        for i, url in enumerate(urls)
+    ]
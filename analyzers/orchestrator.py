@@ -30,6 +30,7 @@ from analyzers.advanced import (
     run_trailing_slash_checks,
     run_noindex_link_checks,
     run_www_consistency_checks,
+    release_page_cache,
 )
 
 
@@ -73,16 +74,10 @@ def run_all_analyzers(
     _emit(progress_callback, f"Analysing {total} pages…", 0)
 
     # ── Per-page analysis ──────────────────────────────────────────────────────
-    per_page = _PER_PAGE_ANALYZERS + (_ADVANCED_PER_PAGE_ANALYZERS if config.advanced_mode else [])
+    per_page = tuple(_PER_PAGE_ANALYZERS + (_ADVANCED_PER_PAGE_ANALYZERS if config.advanced_mode else []))
 
-    for idx, (url, page) in enumerate(all_pages.items()):
-        for analyzer in per_page:
-            try:
-                found = analyzer.analyze(page, all_pages, config)
-                issues.extend(found)
-            except Exception:
-                # Never let one analyzer crash the whole audit
-                pass
+    for idx, page in enumerate(all_pages.values()):
+        _analyze_page(page, all_pages, config, per_page, issues)
 
         if idx % 20 == 0:
             pct = int(idx / max(total, 1) * 70)
@@ -144,13 +139,35 @@ def run_all_analyzers(
     _emit(progress_callback, "Scoring…", 95)
 
     result.issues = issues
-    total_pages = sum(1 for p in all_pages.values() if p.is_html and p.status_code in range(200, 300))
+    total_pages = sum(1 for p in all_pages.values() if p.is_html and 200 <= p.status_code < 300)
     result.health_score, result.category_scores = compute_health_score(issues, total_pages=max(total_pages, 1))
 
     _emit(progress_callback, "Analysis complete.", 100)
     return result
 
 
+def _analyze_page(
+    page: PageData,
+    all_pages: dict[str, PageData],
+    config: AuditConfig,
+    analyzers: tuple,
+    out: list[Issue],
+) -> None:
+    """Run every per-page analyzer on page, appending straight into out."""
+    extend = out.extend
+    for analyzer in analyzers:
+        if not analyzer.applies_to(page):
+            continue
+        # Kept per analyzer: one failure must not skip the rest, and an
+        # unraised try costs nothing on 3.11+
+        try:
+            extend(analyzer.analyze(page, all_pages, config))
+        except Exception:
+            # Never let one analyzer crash the whole audit
+            pass
+    release_page_cache(page)
+
+
 def _emit(callback, message: str, pct: int) -> None:
     if callback:
         try:
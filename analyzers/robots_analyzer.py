@@ -3,9 +3,19 @@ Robots.txt analyzer: validates robots.txt rules, detects blocking of important r
 """
 from __future__ import annotations
 
+import re
+
 from models import AuditConfig, Issue, PageData, RobotsData
 from analyzers.base import BaseAnalyzer
 
+# Disallow paths containing any of these likely cover CSS/JS/image resources.
+# Matched as one regex alternation, so the cost per rule stays a single
+# C-level scan however long this list grows
+_BLOCKED_RESOURCE_PATTERNS = (
+    ".css", ".js", "/css", "/js", "/assets", "/static", "/images", "/img",
+)
+_BLOCKED_RES_RE = re.compile("|".join(map(re.escape, _BLOCKED_RESOURCE_PATTERNS)))
+
 
 class RobotsAnalyzer(BaseAnalyzer):
     category = "Robots"
@@ -51,30 +61,25 @@ class RobotsAnalyzer(BaseAnalyzer):
                 detail=error,
             ))
 
-        # ── Blocking everything ────────────────────────────────────────────────
-        for rule in robots_data.disallow_rules:
-            if rule["agent"] in ("*", config.user_agent.lower()):
-                if rule["path"] == "/":
-                    issues.append(analyzer.critical(
-                        robots_data.url, "robots_blocks_all",
-                        f"robots.txt has 'Disallow: /' for user-agent '{rule['agent']}' — the entire site is blocked from crawling.",
-                        "Remove or correct the Disallow: / rule. This prevents all search engines from crawling the site.",
-                        detail=f"User-agent: {rule['agent']}\nDisallow: /",
-                    ))
-
-        # ── Blocking CSS/JS/images ─────────────────────────────────────────────
-        blocked_resource_patterns = [".css", ".js", "/css", "/js", "/assets", "/static", "/images", "/img"]
+        # ── Blocking everything / blocking CSS/JS/images ──────────────────────
+        # One pass over the rules, each rule's fields read once
+        own_agents = ("*", config.user_agent.lower())
         for rule in robots_data.disallow_rules:
-            path = rule["path"].lower()
-            for pattern in blocked_resource_patterns:
-                if pattern in path:
-                    issues.append(analyzer.warning(
-                        robots_data.url, "robots_blocks_resources",
-                        f"robots.txt blocks access to '{rule['path']}' which may include CSS/JS/image resources needed for rendering.",
-                        "Allow search engines to access CSS, JavaScript, and image files for proper page rendering.",
-                        detail=f"User-agent: {rule['agent']}\nDisallow: {rule['path']}",
-                    ))
-                    break
+            agent, path = rule["agent"], rule["path"]
+            if path == "/" and agent in own_agents:
+                issues.append(analyzer.critical(
+                    robots_data.url, "robots_blocks_all",
+                    f"robots.txt has 'Disallow: /' for user-agent '{agent}' — the entire site is blocked from crawling.",
+                    "Remove or correct the Disallow: / rule. This prevents all search engines from crawling the site.",
+                    detail=f"User-agent: {agent}\nDisallow: /",
+                ))
+            elif _BLOCKED_RES_RE.search(path.lower()):
+                issues.append(analyzer.warning(
+                    robots_data.url, "robots_blocks_resources",
+                    f"robots.txt blocks access to '{path}' which may include CSS/JS/image resources needed for rendering.",
+                    "Allow search engines to access CSS, JavaScript, and image files for proper page rendering.",
+                    detail=f"User-agent: {agent}\nDisallow: {path}",
+                ))
 
         # ── Missing sitemap declaration ────────────────────────────────────────
         if not robots_data.sitemap_urls:
@@ -94,18 +99,23 @@ class RobotsAnalyzer(BaseAnalyzer):
             ))
 
         # ── Pages blocked that should be crawlable ────────────────────────────
-        blocked_but_indexed = []
+        # Only the count and the first example are reported, so nothing is collected
+        first_blocked = None
+        n_blocked = 0
         for url, page in all_pages.items():
-            if page.crawl_error and "robots" in (page.crawl_error or "").lower():
-                if page.is_indexable:  # Would be indexable if not blocked
-                    blocked_but_indexed.append(url)
+            error = page.crawl_error
+            # is_indexable: would be indexable if not blocked
+            if error and page.is_indexable and "robots" in error.lower():
+                if first_blocked is None:
+                    first_blocked = url
+                n_blocked += 1
 
-        if blocked_but_indexed:
+        if n_blocked:
             issues.append(analyzer.warning(
                 robots_data.url, "pages_blocked_by_robots",
-                f"{len(blocked_but_indexed)} page(s) are blocked by robots.txt.",
+                f"{n_blocked} page(s) are blocked by robots.txt.",
                 "Review robots.txt rules. If these pages should be indexed, update the rules to allow access.",
-                detail=f"Example: {blocked_but_indexed[0]}",
+                detail=f"Example: {first_blocked}",
             ))
 
         return issues
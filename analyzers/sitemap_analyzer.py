@@ -53,15 +53,23 @@ class SitemapAnalyzer(BaseAnalyzer):
         # ── Per-URL checks ────────────────────────────────────────────────────
         sitemap_url_set = {u.rstrip("/") for u in sitemap_data.urls}
 
+        # Crawled pages keyed by slash-stripped URL, built once; the slash-less
+        # key wins, as it did in the old stripped-then-slashed lookup order
+        pages_by_norm: dict[str, PageData] = {}
+        for crawled_url, crawled in all_pages.items():
+            norm = crawled_url.rstrip("/")
+            if norm == crawled_url or norm not in pages_by_norm:
+                pages_by_norm[norm] = crawled
+
         for sitemap_url in sitemap_data.urls:
-            norm = sitemap_url.rstrip("/")
-            page = all_pages.get(sitemap_url) or all_pages.get(norm) or all_pages.get(norm + "/")
+            page = all_pages.get(sitemap_url) or pages_by_norm.get(sitemap_url.rstrip("/"))
 
             if page is None:
                 # URL in sitemap but not crawled (might be within limit)
                 continue
 
-            if page.status_code == 0:
+            sc = page.status_code
+            if sc == 0:
                 error_msg = page.crawl_error or "Unknown fetch error"
                 issues.append(analyzer.critical(
                     sitemap_url, "sitemap_url_fetch_error",
@@ -69,12 +77,12 @@ class SitemapAnalyzer(BaseAnalyzer):
                     "Check that the URL is accessible and the server is responding. Fix or remove it from the sitemap.",
                     detail=error_msg,
                 ))
-            elif page.status_code in range(400, 600):
+            elif 400 <= sc < 600:
                 issues.append(analyzer.critical(
                     sitemap_url, "sitemap_url_error",
-                    f"Sitemap URL returns HTTP {page.status_code}.",
+                    f"Sitemap URL returns HTTP {sc}.",
                     "Fix or remove the broken URL from the sitemap. Update to the correct location.",
-                    detail=f"HTTP {page.status_code}",
+                    detail=f"HTTP {sc}",
                 ))
             elif page.redirect_chain:
                 issues.append(analyzer.warning(
@@ -93,15 +101,12 @@ class SitemapAnalyzer(BaseAnalyzer):
         # ── Pages in sitemap not accessible ──────────────────────────────────
 
         # ── Crawled pages not in sitemap ──────────────────────────────────────
-        crawled_not_in_sitemap = 0
-        for url, page in all_pages.items():
-            if not page.is_html or not page.is_indexable:
-                continue
-            if page.status_code not in range(200, 300):
-                continue
-            norm_url = url.rstrip("/")
-            if norm_url not in sitemap_url_set and (norm_url + "/") not in sitemap_url_set:
-                crawled_not_in_sitemap += 1
+        # sitemap_url_set is slash-stripped, so the stripped URL is the only probe needed
+        crawled_not_in_sitemap = sum(
+            1 for url, page in all_pages.items()
+            if page.is_html and page.is_indexable and 200 <= page.status_code < 300
+            and url.rstrip("/") not in sitemap_url_set
+        )
 
         if crawled_not_in_sitemap > 0 and sitemap_data.url_count > 0:
             issues.append(analyzer.info(
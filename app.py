@@ -5,16 +5,19 @@ A comprehensive technical SEO audit tool.
 from __future__ import annotations
 
 import time
+import uuid
 from datetime import datetime
+from typing import Any, Callable
 from urllib.parse import urlparse
 
 import pandas as pd
+import plotly.graph_objects as go
 import streamlit as st
 
 from models import AuditConfig, AuditResult, Issue, PageData, Severity
 from crawler.crawler import crawl
 from analyzers.orchestrator import run_all_analyzers
-from reporting.exporter import issues_to_df, pages_to_df, to_csv_bytes, issues_summary_df
+from reporting.exporter import SEVERITY_DTYPE, issues_to_df, pages_to_df, to_csv_bytes, issues_summary_df
 from scoring.scorer import score_label, score_color
 from ui.charts import (
     health_score_gauge,
@@ -87,7 +90,7 @@ st.markdown("""
 # ── State helpers ──────────────────────────────────────────────────────────────
 
 def _clear_results():
-    for key in ["audit_result", "audit_running"]:
+    for key in ["audit_result", "result_id", "audit_running"]:
         st.session_state.pop(key, None)
 
 
@@ -95,6 +98,73 @@ def _has_result() -> bool:
     return "audit_result" in st.session_state and st.session_state.audit_result is not None
 
 
+def _result_id() -> str:
+    return st.session_state.get("result_id", "")
+
+
+# ── Cached result views ────────────────────────────────────────────────────────
+# A finished AuditResult is never mutated, so the frames and figures derived
+# from it are built once per audit rather than on every widget rerun.
+# Streamlit skips hashing arguments with a leading underscore: the result_id
+# alone is the cache key. These are shared singletons — copy before mutating.
+
+_CACHE_TTL = 24 * 60 * 60
+
+
+@st.cache_resource(show_spinner=False, ttl=_CACHE_TTL, max_entries=8)
+def _pages_df(result_id: str, _pages: dict[str, PageData]) -> pd.DataFrame:
+    return pages_to_df(_pages)
+
+
+@st.cache_resource(show_spinner=False, ttl=_CACHE_TTL, max_entries=8)
+def _issues_df(result_id: str, _issues: list[Issue]) -> pd.DataFrame:
+    return issues_to_df(_issues)
+
+
+@st.cache_resource(show_spinner=False, ttl=_CACHE_TTL, max_entries=8)
+def _summary_df(result_id: str, _issues: list[Issue]) -> pd.DataFrame:
+    return issues_summary_df(_issues)
+
+
+@st.cache_resource(show_spinner=False, ttl=_CACHE_TTL, max_entries=8)
+def _issue_counts(result_id: str, _issues: list[Issue]) -> pd.Series:
+    """Issues per URL, for the Pages table."""
+    return _issues_df(result_id, _issues)["URL"].value_counts(sort=False)
+
+
+@st.cache_resource(show_spinner=False, ttl=_CACHE_TTL, max_entries=8)
+def _category_stats(result_id: str, _by_cat: dict[str, list[Issue]]) -> dict[str, tuple[int, int, int, int]]:
+    """(critical, warning, info, sort rank) per category, counted in one pass."""
+    stats: dict[str, tuple[int, int, int, int]] = {}
+    for cat, cat_issues in _by_cat.items():
+        n_crit = n_warn = n_info = 0
+        for issue in cat_issues:
+            sev = issue.severity
+            if sev == Severity.CRITICAL:
+                n_crit += 1
+            elif sev == Severity.WARNING:
+                n_warn += 1
+            else:
+                n_info += 1
+        stats[cat] = (n_crit, n_warn, n_info, n_crit * 100 + n_warn * 10 + len(cat_issues))
+    return stats
+
+
+@st.cache_resource(show_spinner=False, ttl=_CACHE_TTL, max_entries=24)
+def _csv_bytes(result_id: str, name: str, _df: pd.DataFrame) -> bytes:
+    return to_csv_bytes(_df)
+
+
+@st.cache_resource(show_spinner=False, ttl=_CACHE_TTL, max_entries=64)
+def _cached_chart(result_id: str, name: str, _build: Callable[[Any], go.Figure], _data: Any) -> go.Figure:
+    return _build(_data)
+
+
+def _chart(build: Callable[[Any], go.Figure], data: Any) -> go.Figure:
+    """Build a ui.charts figure once per result; keyed on the builder's name."""
+    return _cached_chart(_result_id(), build.__name__, build, data)
+
+
 # ── Sidebar ────────────────────────────────────────────────────────────────────
 
 def render_sidebar() -> AuditConfig | None:
@@ -219,6 +289,7 @@ def run_audit(config: AuditConfig) -> None:
     status_text.empty()
 
     st.session_state.audit_result = result
+    st.session_state.result_id = uuid.uuid4().hex
     st.rerun()
 
 
@@ -238,7 +309,7 @@ def render_overview(result: AuditResult) -> None:
     col_gauge, col_stats = st.columns([1, 2])
 
     with col_gauge:
-        st.plotly_chart(health_score_gauge(result.health_score), width="stretch")
+        st.plotly_chart(_chart(health_score_gauge, result.health_score), width="stretch")
         label = score_label(result.health_score)
         color = score_color(result.health_score)
         st.markdown(
@@ -263,17 +334,17 @@ def render_overview(result: AuditResult) -> None:
     st.divider()
     c_left, c_right = st.columns(2)
     with c_left:
-        st.plotly_chart(issues_by_category_bar(issues), width="stretch")
+        st.plotly_chart(_chart(issues_by_category_bar, issues), width="stretch")
     with c_right:
-        st.plotly_chart(issues_by_severity_donut(issues), width="stretch")
+        st.plotly_chart(_chart(issues_by_severity_donut, issues), width="stretch")
 
     c1, c2, c3 = st.columns(3)
     with c1:
-        st.plotly_chart(response_time_histogram(pages), width="stretch")
+        st.plotly_chart(_chart(response_time_histogram, pages), width="stretch")
     with c2:
-        st.plotly_chart(page_size_histogram(pages), width="stretch")
+        st.plotly_chart(_chart(page_size_histogram, pages), width="stretch")
     with c3:
-        st.plotly_chart(status_code_bar(pages), width="stretch")
+        st.plotly_chart(_chart(status_code_bar, pages), width="stretch")
 
     # ── Top 20 critical issues ──────────────────────────────────────────────
     st.divider()
@@ -287,7 +358,7 @@ def render_overview(result: AuditResult) -> None:
     # ── Crawl depth ─────────────────────────────────────────────────────────
     st.divider()
     st.subheader("Crawl Depth")
-    st.plotly_chart(crawl_depth_bar(pages), width="stretch")
+    st.plotly_chart(_chart(crawl_depth_bar, pages), width="stretch")
 
 
 # ── Dashboard: Issues by Category ─────────────────────────────────────────────
@@ -298,11 +369,8 @@ def render_by_category(result: AuditResult) -> None:
         st.success("No issues found!")
         return
 
-    categories = sorted(by_cat.keys(), key=lambda c: -(
-        sum(1 for i in by_cat[c] if i.severity == Severity.CRITICAL) * 100 +
-        sum(1 for i in by_cat[c] if i.severity == Severity.WARNING)  * 10  +
-        len(by_cat[c])
-    ))
+    stats = _category_stats(_result_id(), by_cat)
+    categories = sorted(stats, key=lambda c: -stats[c][3])
 
     # Category filter
     cat_filter = st.multiselect(
@@ -323,9 +391,11 @@ def render_by_category(result: AuditResult) -> None:
         if not cat_issues:
             continue
 
-        n_crit = sum(1 for i in cat_issues if i.severity == Severity.CRITICAL)
-        n_warn = sum(1 for i in cat_issues if i.severity == Severity.WARNING)
-        n_info = sum(1 for i in cat_issues if i.severity == Severity.INFO)
+        # Badge counts come from the cached totals, zeroed for filtered-out severities
+        n_crit, n_warn, n_info, _ = stats[cat]
+        n_crit = n_crit if Severity.CRITICAL in sev_filter else 0
+        n_warn = n_warn if Severity.WARNING in sev_filter else 0
+        n_info = n_info if Severity.INFO in sev_filter else 0
 
         badge_html = " ".join([
             f'<span class="pill critical">{n_crit} critical</span>' if n_crit else "",
@@ -367,7 +437,7 @@ def render_pages(result: AuditResult) -> None:
         st.info("No pages crawled.")
         return
 
-    df = pages_to_df(pages)
+    df = _pages_df(_result_id(), pages)
 
     # Filters
     col1, col2, col3 = st.columns(3)
@@ -382,21 +452,21 @@ def render_pages(result: AuditResult) -> None:
             format_func=lambda x: "Indexable" if x else "Non-indexable",
         )
 
-    filtered = df.copy()
+    # One combined mask, so the (cached) frame is sliced once instead of per filter
+    mask = pd.Series(True, index=df.index)
     if search:
-        filtered = filtered[filtered["URL"].str.contains(search, case=False, na=False)]
+        mask &= df["URL"].str.contains(search, case=False, na=False, regex=False)
     if status_filter:
-        filtered = filtered[filtered["Status"].isin(status_filter)]
+        mask &= df["Status"].isin(status_filter)
     if indexable_filter is not None:
-        filtered = filtered[filtered["Indexable"].isin(indexable_filter)]
+        mask &= df["Indexable"].isin(indexable_filter)
+    filtered = df.loc[mask]
 
     st.caption(f"Showing {len(filtered)} of {len(df)} pages")
 
     # Issues count per page
-    url_issue_counts: dict[str, int] = {}
-    for issue in result.issues:
-        url_issue_counts[issue.url] = url_issue_counts.get(issue.url, 0) + 1
-    filtered["Issues"] = filtered["URL"].map(url_issue_counts).fillna(0).astype(int)
+    url_issue_counts = _issue_counts(_result_id(), result.issues)
+    filtered = filtered.assign(Issues=filtered["URL"].map(url_issue_counts).fillna(0).astype(int))
 
     st.dataframe(
         filtered[["URL", "Status", "Title", "Word Count", "Response (ms)", "Size (KB)", "Issues", "Depth", "Indexable"]],
@@ -477,14 +547,15 @@ def render_crawlability(result: AuditResult) -> None:
 
 def render_export(result: AuditResult) -> None:
     st.subheader("Export Data")
+    rid = _result_id()
 
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        df_issues = issues_to_df(result.issues)
+        df_issues = _issues_df(rid, result.issues)
         st.download_button(
             "Download All Issues (CSV)",
-            data=to_csv_bytes(df_issues),
+            data=_csv_bytes(rid, "issues", df_issues),
             file_name=f"issues_{result.config.domain}_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
             mime="text/csv",
             use_container_width=True,
@@ -492,10 +563,10 @@ def render_export(result: AuditResult) -> None:
         st.caption(f"{len(df_issues)} issues")
 
     with col2:
-        df_pages = pages_to_df(result.pages)
+        df_pages = _pages_df(rid, result.pages)
         st.download_button(
             "Download All Pages (CSV)",
-            data=to_csv_bytes(df_pages),
+            data=_csv_bytes(rid, "pages", df_pages),
             file_name=f"pages_{result.config.domain}_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
             mime="text/csv",
             use_container_width=True,
@@ -503,10 +574,10 @@ def render_export(result: AuditResult) -> None:
         st.caption(f"{len(df_pages)} pages")
 
     with col3:
-        df_summary = issues_summary_df(result.issues)
+        df_summary = _summary_df(rid, result.issues)
         st.download_button(
             "Download Issue Summary (CSV)",
-            data=to_csv_bytes(df_summary),
+            data=_csv_bytes(rid, "summary", df_summary),
             file_name=f"summary_{result.config.domain}_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
             mime="text/csv",
             use_container_width=True,
@@ -514,9 +585,8 @@ def render_export(result: AuditResult) -> None:
 
     st.divider()
     st.subheader("All Issues Table")
-    df_issues_full = issues_to_df(result.issues)
-    if not df_issues_full.empty:
-        st.dataframe(df_issues_full, width="stretch", height=600)
+    if not df_issues.empty:
+        st.dataframe(df_issues, width="stretch", height=600)
 
 
 # ── Helpers ────────────────────────────────────────────────────────────────────
@@ -536,29 +606,14 @@ def _render_issue_table(issues: list[Issue]) -> None:
     if not issues:
         return
 
-    rows = []
-    for i in issues:
-        sev_pill = f'<span class="pill {i.severity}">{i.severity}</span>'
-        rows.append({
-            "Sev":   i.severity.upper(),
-            "URL":   i.url,
-            "Issue": _humanize(i.issue_type),
-            "Description": i.description,
-            "Detail": i.detail or "",
-        })
-
-    df = pd.DataFrame(rows)
-
-    sev_order = {Severity.CRITICAL.upper(): 0, Severity.WARNING.upper(): 1, Severity.INFO.upper(): 2}
-    df["_o"] = df["Sev"].map(sev_order)
-    df = df.sort_values("_o").drop(columns=["_o"]).reset_index(drop=True)
-
-    def _sev_style(val):
-        colors = {"CRITICAL": "#FF4B4B", "WARNING": "#FFA500", "INFO": "#4B9EFF"}
-        c = colors.get(val, "#888")
-        return f"color: {c}; font-weight: bold"
-
-    styled = df.style.map(_sev_style, subset=["Sev"])
+    df = pd.DataFrame({
+        "Sev":   pd.Categorical([i.severity.upper() for i in issues], dtype=SEVERITY_DTYPE),
+        "URL":   [i.url for i in issues],
+        "Issue": [_humanize(i.issue_type) for i in issues],
+        "Description": [i.description for i in issues],
+        "Detail": [i.detail or "" for i in issues],
+    })
+    df = df.sort_values("Sev").reset_index(drop=True)
 
     st.dataframe(
         df,
@@ -220,7 +220,7 @@ def _check_external_links(
             if link.url in url_status:
                 status, chain = url_status[link.url]
                 link.status_code = status
-                link.is_broken = status in range(400, 600) or status == 0
+                link.is_broken = 400 <= status < 600 or status == 0
                 link.redirect_chain = chain
 
 
@@ -327,6 +327,6 @@ def _build_stats(result: AuditResult) -> dict:
         "avg_page_size_bytes": int(avg_size),
         "crawl_duration_s": round(result.duration_seconds, 1),
         "indexable_pages": sum(1 for p in pages.values() if p.is_indexable),
-        "broken_pages": sum(1 for p in pages.values() if p.status_code in range(400, 600)),
+        "broken_pages": sum(1 for p in pages.values() if 400 <= p.status_code < 600),
         "redirect_pages": sum(1 for p in pages.values() if p.redirect_chain),
     }
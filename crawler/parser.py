@@ -7,6 +7,7 @@ from __future__ import annotations
 import hashlib
 import json
 import re
+import sys
 from typing import Optional
 from urllib.parse import urljoin, urlparse, urlunparse
 
@@ -21,11 +22,16 @@ from models import (
     ScriptData,
 )
 
+_INTERN_HREFLANG_MAX = 16  # real codes ("x-default", "zh-Hant-TW") fit within this
+
 
 def parse_page(page: PageData, audit_domain: str) -> PageData:
     """
     Populate page fields by parsing page.html.
     Mutates and returns the same PageData object.
+
+    This is the only BeautifulSoup parse of a page: everything stored on it
+    is a plain str/dict/dataclass, so analyzers never see or re-parse a soup.
     """
     if not page.html or not page.is_html:
         return page
@@ -75,17 +81,23 @@ def _parse_meta(soup: BeautifulSoup, page: PageData, base_url: str) -> None:
             page.meta_viewport = content
 
     # Canonical
-    canonical_tag = soup.find("link", rel=lambda r: r and "canonical" in (r if isinstance(r, list) else [r]))
+    canonical_tag = soup.find("link", rel="canonical")
     if canonical_tag:
         href = canonical_tag.get("href", "")
         if href:
             page.canonical_url = urljoin(base_url, href.strip())
 
     # Hreflang
-    for link in soup.find_all("link", rel=lambda r: r and "alternate" in (r if isinstance(r, list) else [r])):
+    for link in soup.find_all("link", rel="alternate"):
         hreflang = link.get("hreflang", "").strip()
         href = link.get("href", "").strip()
         if hreflang and href:
+            # The same few language codes repeat on every page of the site, so
+            # interning stores each once (analyzers lowercase before comparing,
+            # so this saves memory only). Capped because the value is
+            # site-controlled and CPython 3.12 makes interned strings immortal
+            if len(hreflang) <= _INTERN_HREFLANG_MAX:
+                hreflang = sys.intern(hreflang)
             page.hreflang_tags.append(HreflangData(
                 hreflang=hreflang,
                 href=urljoin(base_url, href),
@@ -167,11 +179,11 @@ def _parse_links(
 
         rel = " ".join(a_tag.get("rel", [])) if isinstance(a_tag.get("rel"), list) else str(a_tag.get("rel", ""))
         nofollow = "nofollow" in rel.lower()
-        anchor_text = a_tag.get_text(strip=True)
+        anchor_text = a_tag.get_text(strip=True)[:200]
 
         link = LinkData(
             url=abs_url,
-            anchor_text=anchor_text[:200],
+            anchor_text=anchor_text,
             rel=rel,
             nofollow=nofollow,
         )
@@ -247,7 +259,7 @@ def _parse_scripts(soup: BeautifulSoup, page: PageData, base_url: str) -> None:
         ))
 
     # Stylesheets
-    for link in soup.find_all("link", rel=lambda r: r and "stylesheet" in (r if isinstance(r, list) else [r])):
+    for link in soup.find_all("link", rel="stylesheet"):
         href = link.get("href", "").strip()
         if href:
             page.stylesheets.append(urljoin(base_url, href))
@@ -11,7 +11,9 @@ natively, so the future import is unnecessary.
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from typing import Any, Optional
+from urllib.parse import ParseResult, parse_qs, urlparse
 
 
 # ── Severity ──────────────────────────────────────────────────────────────────
@@ -36,7 +38,8 @@ class Severity:
 
 
 # ── Sub-structures ─────────────────────────────────────────────────────────────
-@dataclass
+# Slotted like Issue: every crawled page carries dozens to thousands of these
+@dataclass(slots=True)
 class LinkData:
     url: str
     anchor_text: str = ""
@@ -47,7 +50,7 @@ class LinkData:
     redirect_chain: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageData:
     src: str
     alt: str = ""
@@ -60,7 +63,7 @@ class ImageData:
     size_bytes: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ScriptData:
     src: str = ""
     is_inline: bool = False
@@ -70,7 +73,7 @@ class ScriptData:
     inline_size_bytes: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class HreflangData:
     hreflang: str
     href: str
@@ -134,9 +137,37 @@ class PageData:
     # Crawl depth (hops from root)
     depth: int = 0
 
+    # Derived URL views — computed on first access, shared by all analyzers
+    @cached_property
+    def parsed_url(self) -> ParseResult:
+        return urlparse(self.url)
+
+    @cached_property
+    def origin(self) -> str:
+        parsed = self.parsed_url
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    @cached_property
+    def query_params(self) -> dict[str, list[str]]:
+        return parse_qs(self.parsed_url.query)
+
+    @cached_property
+    def lower_params(self) -> frozenset[str]:
+        return frozenset(k.lower() for k in self.query_params)
+
+    @cached_property
+    def lower_headers(self) -> dict[str, str]:
+        return {k.lower(): v for k, v in self.response_headers.items()}
+
+    @cached_property
+    def hreflang_hrefs(self) -> frozenset[str]:
+        """Slash-stripped hrefs this page's hreflang tags point to."""
+        return frozenset(t.href.rstrip("/") for t in self.hreflang_tags)
+
 
 # ── Issue model ────────────────────────────────────────────────────────────────
-@dataclass
+# Slotted: a large crawl holds hundreds of thousands of these
+@dataclass(slots=True)
 class Issue:
     url: str
     category: str
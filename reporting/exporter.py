@@ -8,11 +8,15 @@ from typing import Optional
 
 import pandas as pd
 
-from models import AuditResult, Issue, PageData, Severity
+from models import AuditResult, Issue, PageData
 
 
 # ── Issues DataFrame ───────────────────────────────────────────────────────────
 
+# Ordered, so sorting on the Severity column itself gives critical → info
+SEVERITY_DTYPE = pd.CategoricalDtype(["CRITICAL", "WARNING", "INFO"], ordered=True)
+
+
 def issues_to_df(issues: list[Issue]) -> pd.DataFrame:
     if not issues:
         return pd.DataFrame(columns=["Severity", "Category", "Issue", "URL", "Detail", "Recommendation"])
@@ -30,12 +34,8 @@ def issues_to_df(issues: list[Issue]) -> pd.DataFrame:
         })
 
     df = pd.DataFrame(rows)
-
-    # Severity sort order
-    severity_order = {Severity.CRITICAL: 0, Severity.WARNING: 1, Severity.INFO: 2}
-    df["_sev_order"] = df["Severity"].str.lower().map(severity_order)
-    df = df.sort_values(["_sev_order", "Category", "URL"]).drop(columns=["_sev_order"])
-    df = df.reset_index(drop=True)
+    df["Severity"] = df["Severity"].astype(SEVERITY_DTYPE)
+    df = df.sort_values(["Severity", "Category", "URL"]).reset_index(drop=True)
     return df
 
 